@@ -1,9 +1,142 @@
 import csv
 import os
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, TextIO
+import numpy
 import pandas
 
 
+# Buffer size for CSV output files (1 MiB), so large files need far fewer write syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Binary columnar formats written through pandas/pyarrow instead of the csv module.
+# A low zstd level keeps compression from dominating the write time.
+_BINARY_WRITERS = {
+    '.parquet': 'to_parquet',
+    '.feather': 'to_feather',
+}
+
+
+def _check_output_file(outputFile: str) -> None:
+    """
+    Checks that the output file shared by all writers does not exist yet.
+
+    Raises:
+        FileExistsError: If the output file already exists.
+    """
+    # A single stat call, treating any failure to stat the path as "does not exist" (as os.path.exists)
+    try:
+        os.stat(outputFile)
+    except (OSError, ValueError):
+        return
+
+    raise FileExistsError(f"The output file '{outputFile}' already exists.")
+
+
+def _check_separator(separator: str) -> None:
+    """
+    Checks the separator used by all CSV writers (binary outputs do not use it).
+
+    Raises:
+        TypeError: If the separator is not a single character.
+    """
+    if not isinstance(separator, str) or len(separator) != 1:
+        raise TypeError(f"The separator must be a 1-character string, but received {separator!r}")
+
+
+def _binary_writer(outputFile: str) -> str | None:
+    """
+    Returns the name of the DataFrame writer for binary output files, or None for CSV output.
+    """
+    return _BINARY_WRITERS.get(os.path.splitext(outputFile)[1].lower())
+
+
+def _write_binary(dataFrame: pandas.DataFrame, outputFile: str, writerName: str) -> None:
+    """
+    Writes a DataFrame to a Parquet/Feather file using zstd compression.
+    """
+    getattr(dataFrame, writerName)(outputFile, compression='zstd', compression_level=1)
+
+
+# Python types whose columns can be stringified by numpy without changing their CSV output.
+# numpy scalars are left to pandas, whose inference for mixed numpy types (uint64, float32...) differs from numpy's
+_NUMERIC_TYPES = frozenset((int, float))
+
+# Characters that may appear in a formatted number, and so cannot be used unquoted as separator
+_NUMERIC_CHARS = frozenset('0123456789+-.einfa')
+
+# Range of ints that numpy and pandas store exactly alongside floats
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Number of rows formatted and written at a time by the numeric fast path
+_NUMERIC_CHUNK_ROWS = 65536
+
+
+def _numeric_arrays(columns: list) -> list[numpy.ndarray] | None:
+    """
+    Converts the columns to numpy arrays if all of them hold only Python int and float values
+    fitting a numeric dtype. Returns None otherwise.
+    """
+    arrays = []
+    for column in columns:
+        kinds = set(map(type, column))
+        if not kinds <= _NUMERIC_TYPES:
+            return None
+
+        array = numpy.asarray(column)
+        if array.dtype.kind not in 'iuf':
+            return None
+
+        # Ints beyond int64 are coerced to float64 when mixed with other values, losing their exact values
+        # (pandas keeps them as exact objects instead)
+        if array.dtype.kind == 'f' and int in kinds and not all(_INT64_MIN <= value <= _INT64_MAX
+                                                                for value in column if type(value) is int):
+            return None
+        arrays.append(array)
+
+    return arrays
+
+
+# Python types that csv.writer formats exactly as pandas' to_csv does (None being written as an empty field)
+_PLAIN_TYPES = frozenset((str, bool, int, float, type(None)))
+
+
+def _is_plain_column(column: list | tuple) -> bool:
+    """
+    Checks if csv.writer would write a column exactly as pandas does. Columns that pandas would convert
+    (ints with None and ints mixed with floats become float64) or format on its own (NaN, datetimes...)
+    are not plain.
+    """
+    kinds = set(map(type, column))
+    if not kinds <= _PLAIN_TYPES:
+        return False
+
+    if int in kinds and (float in kinds or type(None) in kinds):
+        return False
+
+    return float not in kinds or not any(value != value for value in column)
+
+
+def _write_numeric_rows(file: TextIO, arrays: list[numpy.ndarray], separator: str) -> None:
+    """
+    Writes numeric arrays as CSV rows, stringifying each column block in a single numpy call.
+    Rows are written in blocks of _NUMERIC_CHUNK_ROWS, so only one block of strings is held at a time.
+    Missing values (NaN) are written as empty fields, as pandas does (quoted in single-column tables,
+    so that they are not read back as blank lines).
+    """
+    missing = '""' if len(arrays) == 1 else ''
+    for start in range(0, len(arrays[0]), _NUMERIC_CHUNK_ROWS):
+        strings = []
+        for array in arrays:
+            block = array[start:start + _NUMERIC_CHUNK_ROWS]
+            formatted = block.astype(str)
+            if block.dtype.kind == 'f':
+                formatted[numpy.isnan(block)] = missing
+            strings.append(formatted.tolist())
+
+        file.write(''.join(separator.join(row) + os.linesep for row in zip(*strings)))
+
+
 def DICTtoCSV(data: dict, outputFile: str, separator: str = ',') -> None:
     """
     Converts a dictionary to a CSV file.
@@ -13,45 +146,103 @@ def DICTtoCSV(data: dict, outputFile: str, separator: str = ',') -> None:
                      and the values will be the corresponding rows in the CSV file.
         outputFile (str): The path to the output CSV file. If the file already exists, a
                           FileExistsError will be raised.
+                          Files ending in '.parquet' or '.feather' are written in that format
+                          instead (requires 'pyarrow').
         separator (str, optional): The character that separates the values in the CSV file.
                                    Defaults to ','.
 
     Raises:
         FileExistsError: If the output file already exists.
+        TypeError: If the separator is not a single character (CSV output only).
+        ValueError: If the columns are not all of the same length.
 
     Returns:
         None: This function does not return a value. It writes the CSV data to the specified file.
     """
-    if os.path.exists(outputFile):
-        raise FileExistsError
+    _check_output_file(outputFile)
+
+    writerName = _binary_writer(outputFile)
+    if writerName:
+        _write_binary(pandas.DataFrame(data), outputFile, writerName)
+        return
+
+    _check_separator(separator)
+
+    columns = list(data.values())
+
+    # Plain dict-of-lists needs no alignment, so the rows can be transposed and written directly
+    if all(isinstance(column, (list, tuple)) for column in columns):
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All columns must be of the same length")
 
+        # Numeric tables never need quoting, so they are formatted by numpy, column by column
+        arrays = _numeric_arrays(columns) if separator not in _NUMERIC_CHARS else None
+
+        # The keys are inferred by pandas just as a column is (tuples even become MultiIndex header rows),
+        # so they are only written directly when plain as well
+        if _is_plain_column(list(data)) and (arrays or all(_is_plain_column(column) for column in columns)):
+            with open(outputFile, mode='w', newline='', buffering=_WRITE_BUFFER_SIZE, encoding='utf-8') as file:
+                writer = csv.writer(file, delimiter=separator, doublequote=True, lineterminator=os.linesep)
+                writer.writerow(data.keys())
+
+                if arrays:
+                    _write_numeric_rows(file, arrays, separator)
+                else:
+                    writer.writerows(zip(*columns))
+            return
+
+    # Other columns (dicts, Series, arrays, values pandas formats on its own...) are written by pandas
     pandas.DataFrame(data).to_csv(path_or_buf=outputFile, sep=separator, index=False, doublequote=True)
 
 
 
-def LISTtoCSV(listHeaders: list[str], listContents: list[list[Any]], outputFile: str, separator: str = ',') -> None:
+def LISTtoCSV(listHeaders: list[str], listContents: Iterable[list[Any]], outputFile: str, separator: str = ',',
+              chunkSize: int = 65536) -> None:
     """
     Writes a list of headers and a list of content rows to a CSV file.
 
     Args:
         listHeaders (list[str]): A list of strings representing the headers for the CSV file.
-        listContents (list[list[Any]]): A list of lists where each inner list represents a row of content
-                                         corresponding to the headers.
+        listContents (Iterable[list[Any]]): A list of lists where each inner list represents a row of content
+                                            corresponding to the headers. Any iterable of rows (e.g. a
+                                            generator) is also accepted, and is consumed in chunks.
         outputFile (str): The path to the output CSV file. If the file already exists, a
                           FileExistsError will be raised.
+                          Files ending in '.parquet' or '.feather' are written in that format
+                          instead (requires 'pyarrow').
         separator (str, optional): The character that separates the values in the CSV file.
                                    Defaults to ','.
+        chunkSize (int, optional): Number of rows handed to the CSV writer at a time. Defaults to 65536.
 
     Raises:
         FileExistsError: If the output file already exists.
+        TypeError: If the separator is not a single character (CSV output only).
+        ValueError: If chunkSize is lesser than 1.
 
     Returns:
         None: This function does not return a value. It writes the CSV data to the specified file.
     """
-    if os.path.exists(outputFile):
-        raise FileExistsError
+    _check_output_file(outputFile)
+
+    if chunkSize < 1:
+        raise ValueError(f"The chunk size must be at least 1, but received {chunkSize}")
 
-    with open(outputFile, mode='w', newline='') as file:
+    writerName = _binary_writer(outputFile)
+    if writerName:
+        _write_binary(pandas.DataFrame(listContents, columns=listHeaders), outputFile, writerName)
+        return
+
+    _check_separator(separator)
+
+    with open(outputFile, mode='w', newline='', buffering=_WRITE_BUFFER_SIZE, encoding='utf-8') as file:
         writer = csv.writer(file, delimiter=separator, doublequote=True)
         writer.writerow(listHeaders)
-        writer.writerows(listContents)
+
+        # Write the rows in chunks, so iterators are never fully materialized
+        if isinstance(listContents, list):
+            for start in range(0, len(listContents), chunkSize):
+                writer.writerows(listContents[start:start + chunkSize])
+        else:
+            rows = iter(listContents)
+            while chunk := list(islice(rows, chunkSize)):
+                writer.writerows(chunk)
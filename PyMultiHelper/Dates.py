@@ -1,6 +1,30 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
+import functools
+import numpy
+import operator
 import pytz
-import re
+
+
+@functools.lru_cache(maxsize=128)
+def _get_tz(tzString: str) -> tzinfo:
+    """
+    Resolves (and caches) a timezone name or offset string into a tzinfo object.
+
+    Raises:
+        ValueError: If the tzString is not a valid timezone or offset.
+    """
+    try:
+        # Check if tzString is a valid offset
+        if tzString.startswith('-') or tzString.startswith('+'):
+            offset_hours, offset_minutes = map(int, tzString[1:].split(':'))
+            offset = timedelta(hours=offset_hours, minutes=offset_minutes)
+            return timezone(offset if tzString.startswith('+') else -offset)
+
+        # Assume it's a timezone name
+        return pytz.timezone(tzString)
+    except (pytz.UnknownTimeZoneError, ValueError):
+        raise ValueError(
+            f"The provided timezone '{tzString}' is not valid. Please provide a valid timezone or offset.")
 
 
 def dateRanges(startDate: str, endDate: str, rangeSize: int = 30):
@@ -17,36 +41,38 @@ def dateRanges(startDate: str, endDate: str, rangeSize: int = 30):
         Returns:
             list(str, str): List of one or more date ranges, each one with the max specified range size.
 
+        Raises:
+            ValueError: If a date is not in the 'YYYY-MM-DD' format, or rangeSize is not a whole number
+                        of days of at least 1.
+
         Examples:
             >>> dateRanges("2020-02-25", "2020-08-24", 90)
         """
 
-    ranges = []
+    # Accept integral floats (e.g. 2.0) as a whole number of days, as timedelta does
+    if isinstance(rangeSize, float) and rangeSize.is_integer():
+        rangeSize = int(rangeSize)
 
-    # Convert date strings to datetime objects
-    inicio = datetime.strptime(startDate, '%Y-%m-%d')
-    fim = datetime.strptime(endDate, '%Y-%m-%d')
-
-    # Define an interval
-    one_month = timedelta(days=rangeSize)
+    try:
+        rangeSize = operator.index(rangeSize)
+    except TypeError:
+        raise ValueError(f"The range size must be a whole number of days, but received {rangeSize!r}") from None
 
-    # Define the current date as the starting date
-    data_atual = inicio
+    if rangeSize < 1:
+        raise ValueError(f"The range size must be at least 1 day, but received {rangeSize}")
 
-    # Loop while the current date is lesser or equal the final date
-    while data_atual <= fim:
-        # Define the start and end date of the current interval
-        inicio_intervalo = data_atual
-        fim_intervalo = min(data_atual + one_month - timedelta(days=1), fim)
+    # Convert date strings to daily numpy datetimes
+    inicio = numpy.datetime64(datetime.strptime(startDate, '%Y-%m-%d').date(), 'D')
+    fim = numpy.datetime64(datetime.strptime(endDate, '%Y-%m-%d').date(), 'D')
 
-        # Add the interval to the ranges list
-        ranges.append((inicio_intervalo.strftime('%Y-%m-%d'), fim_intervalo.strftime('%Y-%m-%d')))
+    # Start of every interval, from the starting date up to (and including) the final date
+    starts = numpy.arange(inicio, fim + numpy.timedelta64(1, 'D'), numpy.timedelta64(rangeSize, 'D'))
 
-        # Add a month to the current date
-        data_atual += one_month
+    # End of every interval, limited to the final date
+    ends = numpy.minimum(starts + numpy.timedelta64(rangeSize - 1, 'D'), fim)
 
-    # Return the ranges list
-    return ranges
+    # Return the ranges list, with dates formatted as 'YYYY-MM-DD'
+    return list(zip(starts.astype(str).tolist(), ends.astype(str).tolist()))
 
 
 def STRtoDATETIME(dateString: str) -> datetime:
@@ -54,7 +80,7 @@ def STRtoDATETIME(dateString: str) -> datetime:
     Transforms a datetime string into a datetime object.
 
     Args:
-        dateString (str): A datetime string, which can be in various formats, e.g.
+        dateString (str): A datetime string in any ISO 8601 format accepted by `datetime.fromisoformat`, e.g.
                      '2022-08-01T12:53:40.000Z' or '2022-08-01 12:53:40+00:00'.
 
     Returns:
@@ -63,19 +89,14 @@ def STRtoDATETIME(dateString: str) -> datetime:
     Raises:
         ValueError: If the provided string is not a valid datetime format.
     """
-    # Regular expression to validate datetime formats
-    pattern = r'^\d{4}[-/]\d{2}[-/]\d{2}(?:[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?)?$'
+    # Normalize the 'Z' suffix (not accepted by fromisoformat before Python 3.11)
+    isoformat_str = dateString.replace('Z', '+00:00')
 
-    if not re.match(pattern, dateString):
-        raise ValueError(f"The provided string '{dateString}' is not a valid datetime format.")
-
-    # Normalize the string to ensure it has a timezone
-    if 'Z' in dateString:
-        isoformat_str = dateString.replace('Z', '+00:00')
-    else:
-        isoformat_str = dateString
-
-    return datetime.fromisoformat(isoformat_str)
+    # fromisoformat validates the string itself, so no separate regex check is needed
+    try:
+        return datetime.fromisoformat(isoformat_str)
+    except ValueError as e:
+        raise ValueError(f"The provided string '{dateString}' is not a valid datetime format.") from e
 
 
 def DATETIMEtoSTR(date: datetime, tzString: str = 'UTC') -> str:
@@ -94,19 +115,8 @@ def DATETIMEtoSTR(date: datetime, tzString: str = 'UTC') -> str:
     Raises:
         ValueError: If the tzString is not a valid timezone or offset.
     """
-    # Validate the timezone_str
-    try:
-        # Check if timezone_str is a valid offset
-        if tzString.startswith('-') or tzString.startswith('+'):
-            offset_hours, offset_minutes = map(int, tzString[1:].split(':'))
-            offset = timedelta(hours=offset_hours, minutes=offset_minutes)
-            tz = timezone(offset if tzString.startswith('+') else -offset)
-        else:
-            # Assume it's a timezone name
-            tz = pytz.timezone(tzString)
-    except (pytz.UnknownTimeZoneError, ValueError):
-        raise ValueError(
-            f"The provided timezone '{tzString}' is not valid. Please provide a valid timezone or offset.")
+    # Validate and resolve the timezone
+    tz = _get_tz(tzString)
 
     # Convert to the specified timezone
     date = date.astimezone(tz)
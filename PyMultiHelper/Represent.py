@@ -1,15 +1,24 @@
+import sys
+
+
+# Number of output lines collected before being written to stdout at once
+_FLUSH_LINES = 1024
+
+
 def traverseJSON(data: dict | list) -> None:
     """
-    Recursively prints the keys and values of a JSON structure.
+    Prints the keys and values of a JSON structure, including all nested levels.
 
     This function traverses a JSON-like dictionary or list and prints the keys
     in a hierarchical format. If the value is not a dict or list, it prints the key along with its value.
+    The traversal uses an explicit stack, so arbitrarily deep structures are supported.
 
     Args:
         data (dict or list): The JSON to traverse.
 
     Raises:
         TypeError: If 'data' is not a dict or list.
+        ValueError: If 'data' contains a circular reference.
 
     Returns:
         None
@@ -19,24 +28,46 @@ def traverseJSON(data: dict | list) -> None:
     if not isinstance(data, (dict, list)):
         raise TypeError(f"Expected 'dict' or 'list', but received {type(data).__name__}")
 
-    def _print_keys(innerData, prefix=""):
+    def _children(innerData, prefix):
+        # Yield the prefixed key (or index) of each child, paired with its value
         if isinstance(innerData, dict):
             for key, value in innerData.items():
-                new_prefix = f"{prefix}.{key}" if prefix else key
-                # Print key and value if it's not a list or dict
-                if not isinstance(value, (list, dict)):
-                    print(f"{new_prefix}  -->  {value}")
-                # Recursively call the function for nested dicts or lists
-                _print_keys(value, new_prefix)
-
-        elif isinstance(innerData, list):
+                yield (f"{prefix}.{key}" if prefix else key), value
+        else:
             for index, item in enumerate(innerData):
-                new_prefix = f"{prefix}[{index}]"
-                # Print item if it's not a list or dict
-                if not isinstance(item, (list, dict)):
-                    print(f"{new_prefix}  -->  {item}")
-                # Recursively call the function for nested dicts or lists
-                _print_keys(item, new_prefix)
-
-    # Call the inner function to start the recursion
-    _print_keys(data)
\ No newline at end of file
+                yield f"{prefix}[{index}]", item
+
+    def _print_keys(innerData):
+        lines = []
+
+        # Stack of children iterators, one per nested dict or list being traversed,
+        # along with the ids of those containers (to detect circular references)
+        stack = [_children(innerData, "")]
+        path = [id(innerData)]
+        on_path = {id(innerData)}
+        try:
+            while stack:
+                for new_prefix, value in stack[-1]:
+                    # Descend into nested dicts or lists, resuming the current one afterwards
+                    if isinstance(value, (list, dict)):
+                        if id(value) in on_path:
+                            raise ValueError(f"Circular reference found at '{new_prefix}'")
+                        stack.append(_children(value, new_prefix))
+                        path.append(id(value))
+                        on_path.add(id(value))
+                        break
+
+                    # Collect key and value if it's not a list or dict
+                    lines.append(f"{new_prefix}  -->  {value}\n")
+                    if len(lines) >= _FLUSH_LINES:
+                        sys.stdout.write("".join(lines))
+                        lines.clear()
+                else:
+                    stack.pop()
+                    on_path.discard(path.pop())
+        finally:
+            # Write out the remaining lines, even if the traversal was interrupted by an error
+            sys.stdout.write("".join(lines))
+
+    # Call the inner function to start the traversal
+    _print_keys(data)
@@ -1,7 +1,74 @@
+import functools
 import re
 from datetime import datetime
 from urllib.parse import urlparse
 import json
+from typing import Iterable
+
+try:
+    # Optional faster parser; json.loads remains the reference when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Email Regex (critical validation)
+# Explanation:
+# - Begins with alphanumeric characters or certain special characters (-, _, .)
+# - A single '@' symbol
+# - Domain name with at least one period
+# - Ends with a valid domain suffix (2-24 letters)
+# (No anchors, as it is matched against the whole string with 'fullmatch')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,24}')
+
+# Phone numbers with optional country code, DDD, and valid digit formats
+_PHONE_RE = re.compile(r'^(\+\d{1,3} ?)?( ?\d{2,3} |(\(\d{2,3}\))|( ?\(\d{2,3}\) ))(\d{4,5}-?\d{4})$|^(\d{4,5}-?\d{4})$')
+
+# Date formats with consistent separators, merged into a single alternation.
+# Each alternative captures its own separator, which must be repeated (all separators must be the same).
+# The date patterns have no anchors, as they are matched against the whole string with 'fullmatch'
+_DATE_RE = re.compile(r'''
+    (?:
+        # DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY
+        (?:0[1-9]|[12][0-9]|3[01])(?P<s1>[\/\-\.])(?:0[1-9]|1[0-2])(?P=s1)\d{4}
+
+        # MM/DD/YYYY, MM-DD-YYYY, MM.DD.YYYY
+      | (?:0[1-9]|1[0-2])(?P<s2>[\/\-\.])(?:0[1-9]|[12][0-9]|3[01])(?P=s2)\d{4}
+
+        # YYYY/MM/DD, YYYY-MM-DD, YYYY.MM.DD
+      | \d{4}(?P<s3>[\/\-\.])(?:0[1-9]|1[0-2])(?P=s3)(?:0[1-9]|[12][0-9]|3[01])
+
+        # DD/MM/YY, DD-MM-YY, DD.MM.YY
+      | (?:0[1-9]|[12][0-9]|3[01])(?P<s4>[\/\-\.])(?:0[1-9]|1[0-2])(?P=s4)\d{2}
+
+        # MM/DD/YY, MM-DD-YY, MM.DD.YY
+      | (?:0[1-9]|1[0-2])(?P<s5>[\/\-\.])(?:0[1-9]|[12][0-9]|3[01])(?P=s5)\d{2}
+
+        # YY/MM/DD, YY-MM-DD, YY.MM.DD
+      | \d{2}(?P<s6>[\/\-\.])(?:0[1-9]|1[0-2])(?P=s6)(?:0[1-9]|[12][0-9]|3[01])
+    )''', re.VERBOSE)
+
+# Lengths of every string accepted by _DATE_RE (2-digit or 4-digit years), used to reject inputs before matching
+_DATE_LENGTHS = frozenset((8, 10))
+
+# YYYY-MM-DD, YYYY/MM/DD, or YYYY.MM.DD
+_DATE_8601_RE = re.compile(r'(\d{4})([\/\-\.])(0[1-9]|1[0-2])\2(0[1-9]|[12][0-9]|3[01])')
+
+# Regexes replicating the directive patterns used by `strptime`, for the most common date formats.
+# Validating these directly (and building the datetime from the groups) avoids the `strptime` machinery
+_STRPTIME_YMD = r'(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])'
+_FAST_DATE_FORMATS = {
+    '%Y-%m-%d': re.compile(_STRPTIME_YMD),
+    '%Y-%m-%d %H:%M:%S': re.compile(_STRPTIME_YMD + r'\s+(2[0-3]|[01]\d|\d):([0-5]\d|\d):(6[01]|[0-5]\d|\d)'),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(regex: str) -> re.Pattern:
+    """
+    Compiles (and caches) a user-supplied regular expression pattern.
+    """
+    return re.compile(regex)
 
 
 def isValidEmail(email: str) -> bool:
@@ -18,17 +85,8 @@ def isValidEmail(email: str) -> bool:
         ValueError: If the input is not a string.
     """
 
-    # Email Regex (critical validation)
-    # Explanation:
-    # - Begins with alphanumeric characters or certain special characters (-, _, .)
-    # - A single '@' symbol
-    # - Domain name with at least one period
-    # - Ends with a valid domain suffix (2-4 characters)
-
-    email_regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,4}$'
-
     # Match the regex against the provided email
-    return re.match(email_regex, email) is not None
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def isValidURL(url: str) -> bool:
@@ -60,10 +118,7 @@ def isValidPhone(phone: str) -> bool:
     Returns:
         bool: True if the phone number is valid, False otherwise.
     """
-    # Regular expression to match phone numbers with optional country code, DDD, and valid digit formats
-    phone_regex = re.compile(r'^(\+\d{1,3} ?)?( ?\d{2,3} |(\(\d{2,3}\))|( ?\(\d{2,3}\) ))(\d{4,5}-?\d{4})$|^(\d{4,5}-?\d{4})$')
-
-    return bool(phone_regex.match(phone))
+    return bool(_PHONE_RE.match(phone))
 
 
 def isValidJSON(json_string: str) -> bool:
@@ -76,6 +131,14 @@ def isValidJSON(json_string: str) -> bool:
     Returns:
         bool: True if the string is valid JSON, False otherwise.
     """
+    # Everything 'orjson' accepts is also valid for 'json', so only its rejections need a second check
+    if orjson is not None:
+        try:
+            orjson.loads(json_string)
+            return True
+        except orjson.JSONDecodeError:
+            pass
+
     try:
         json.loads(json_string)
         return True
@@ -97,33 +160,28 @@ def isValidDate(dateString: str) -> bool:
 
     """
 
-    # Define regex patterns for consistent separators in date formats
-    date_patterns = [
-        # DD/MM/YYYY, DD-MM-YYYY, DD.MM.YYYY (all separators must be the same)
-        r'^(0[1-9]|[12][0-9]|3[01])([\/\-\.])(0[1-9]|1[0-2])\2(\d{4})$',
-
-        # MM/DD/YYYY, MM-DD-YYYY, MM.DD.YYYY
-        r'^(0[1-9]|1[0-2])([\/\-\.])(0[1-9]|[12][0-9]|3[01])\2(\d{4})$',
-
-        # YYYY/MM/DD, YYYY-MM-DD, YYYY.MM.DD
-        r'^(\d{4})([\/\-\.])(0[1-9]|1[0-2])\2(0[1-9]|[12][0-9]|3[01])$',
+    # Reject strings of impossible length, then match against all date formats at once
+    return len(dateString) in _DATE_LENGTHS and _DATE_RE.fullmatch(dateString) is not None
 
-        # DD/MM/YY, DD-MM-YY, DD.MM.YY
-        r'^(0[1-9]|[12][0-9]|3[01])([\/\-\.])(0[1-9]|1[0-2])\2(\d{2})$',
 
-        # MM/DD/YY, MM-DD-YY, MM.DD.YY
-        r'^(0[1-9]|1[0-2])([\/\-\.])(0[1-9]|[12][0-9]|3[01])\2(\d{2})$',
+def isValidDateMany(dateStrings: Iterable[str]) -> list[bool]:
+    """
+    Validates many date strings at once, with the same formats accepted by `isValidDate`.
+    Useful for validating whole columns, avoiding the per-call overhead of `isValidDate`.
 
-        # YY/MM/DD, YY-MM-DD, YY.MM.DD
-        r'^(\d{2})([\/\-\.])(0[1-9]|1[0-2])\2(0[1-9]|[12][0-9]|3[01])$'
-    ]
+    Args:
+        dateStrings (Iterable[str]): The date strings to be validated.
 
-    # Iterate over all patterns to check for a match
-    for pattern in date_patterns:
-        if re.match(pattern, dateString):
-            return True
+    Returns:
+        list[bool]: For each date string (in the same order), True if the date is valid, False otherwise.
 
-    return False
+    Example:
+    >>> isValidDateMany(["31/12/2020", "2020-13-01"])
+    [True, False]
+    """
+    match = _DATE_RE.fullmatch
+    lengths = _DATE_LENGTHS
+    return [len(dateString) in lengths and match(dateString) is not None for dateString in dateStrings]
 
 
 def validateDateFormat(dateString: str, dateFormat: str) -> bool:
@@ -155,9 +213,18 @@ def validateDateFormat(dateString: str, dateFormat: str) -> bool:
     Raises:
         ValueError: If the date format is invalid or not recognized.
     """
+    fastPattern = _FAST_DATE_FORMATS.get(dateFormat)
+
     try:
-        # Try to parse the date string with the provided format
-        datetime.strptime(dateString, dateFormat)
+        if fastPattern is None:
+            # Try to parse the date string with the provided format
+            datetime.strptime(dateString, dateFormat)
+        else:
+            # Common formats are matched directly, leaving datetime to validate the values (e.g. day 31)
+            found = fastPattern.fullmatch(dateString)
+            if found is None:
+                return False
+            datetime(*map(int, found.groups()))
         return True
     except ValueError:
         # If parsing fails, it raises a ValueError and returns False
@@ -177,11 +244,8 @@ def validateDate_8601(dateString: str) -> bool:
 
     """
 
-    # Regex pattern for YYYY-MM-DD, YYYY/MM/DD, or YYYY.MM.DD
-    pattern = r'^(\d{4})([\/\-\.])(0[1-9]|1[0-2])\2(0[1-9]|[12][0-9]|3[01])$'
-
-    # Match against the pattern
-    if re.match(pattern, dateString):
+    # Match against the YYYY-MM-DD pattern
+    if _DATE_8601_RE.fullmatch(dateString):
         return True
 
     return False
@@ -217,8 +281,8 @@ def matchesRegex(string: str, regex: str) -> bool:
         bool: True if the regex pattern is found in the string, False otherwise.
     """
 
-    # Compile the regular expression pattern
-    pattern = re.compile(regex)
+    # Compile the regular expression pattern (cached across calls)
+    pattern = _compile_regex(regex)
 
     # Search for the regex pattern in the string
     return bool(pattern.search(string))
\ No newline at end of file